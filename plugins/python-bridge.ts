@@ -2,7 +2,7 @@
  * Python Bridge Plugin
  * 
  * Enables Ronin plugins to execute Python code and communicate with Python subprocesses via IPC.
- * Uses JSON-over-stdin/stdout with null-byte framing for reliable message boundaries.
+ * Uses JSON-over-stdin/stdout with length-prefixed framing for reliable message boundaries.
  * 
  * @example
  * // Execute Python code inline
@@ -21,6 +21,43 @@ import { spawn, type ChildProcess } from "bun";
 import { join } from "path";
 import { existsSync } from "fs";
 
+/**
+ * Size of the big-endian length prefix on every IPC frame
+ */
+const FRAME_HEADER_SIZE = 4;
+
+/**
+ * Prefix a payload with its big-endian length
+ */
+export function encodeFrame(payload: Uint8Array): Uint8Array {
+  const frame = new Uint8Array(FRAME_HEADER_SIZE + payload.length);
+  new DataView(frame.buffer).setUint32(0, payload.length);
+  frame.set(payload, FRAME_HEADER_SIZE);
+  return frame;
+}
+
+/**
+ * Split every complete length-prefixed frame off the front of a buffer
+ *
+ * @returns Frame payloads in order, plus the bytes of any trailing partial frame
+ */
+export function decodeFrames(buffer: Uint8Array): { frames: Uint8Array[]; rest: Uint8Array } {
+  const frames: Uint8Array[] = [];
+  let offset = 0;
+
+  while (buffer.length - offset >= FRAME_HEADER_SIZE) {
+    const view = new DataView(buffer.buffer, buffer.byteOffset + offset);
+    const size = view.getUint32(0);
+    const end = offset + FRAME_HEADER_SIZE + size;
+    if (end > buffer.length) break;
+
+    frames.push(buffer.subarray(offset + FRAME_HEADER_SIZE, end));
+    offset = end;
+  }
+
+  return { frames, rest: buffer.slice(offset) };
+}
+
 /**
  * Message frame for Python ↔ Bun IPC
  */
@@ -52,7 +89,9 @@ export class PythonBackendHandle {
     reject: (error: Error) => void;
     timer?: NodeJS.Timeout;
   }> = new Map();
-  private buffer = "";
+  private buffer: Uint8Array = new Uint8Array(0);
+  private decoder = new TextDecoder();
+  private encoder = new TextEncoder();
   private eventHandlers: Map<string, Set<(data: unknown) => void>> = new Map();
   private scriptPath: string;
   private env?: Record<string, string>;
@@ -151,11 +190,13 @@ export class PythonBackendHandle {
           const { done, value } = await reader.read();
           if (done) break;
 
-          // Decode and buffer
-          const text = new TextDecoder().decode(value);
-          this.buffer += text;
+          // Append to buffer
+          const merged = new Uint8Array(this.buffer.length + value.length);
+          merged.set(this.buffer);
+          merged.set(value, this.buffer.length);
+          this.buffer = merged;
 
-          // Process complete messages (delimited by \0)
+          // Process complete length-prefixed frames
           this.processBuffer();
         }
       } catch (error) {
@@ -170,14 +211,13 @@ export class PythonBackendHandle {
    * Process buffered stdout data
    */
   private processBuffer(): void {
-    // Split on null byte delimiter
-    const messages = this.buffer.split("\0");
-    
-    // Keep incomplete message in buffer
-    this.buffer = messages.pop() || "";
+    const { frames, rest } = decodeFrames(this.buffer);
+
+    // Keep incomplete frame in buffer
+    this.buffer = rest;
 
-    for (const msg of messages) {
-      if (!msg.trim()) continue;
+    for (const frame of frames) {
+      const msg = this.decoder.decode(frame);
 
       try {
         const response: PythonResponse = JSON.parse(msg);
@@ -278,12 +318,12 @@ export class PythonBackendHandle {
       // Store pending request
       this.pendingRequests.set(id, { resolve, reject, timer });
 
-      // Send message
+      // Send message as a length-prefixed frame
       const message: PythonMessage = { id, cmd, params };
-      const json = JSON.stringify(message) + "\n";
+      const frame = encodeFrame(this.encoder.encode(JSON.stringify(message)));
       
       try {
-        this.process?.stdin?.write(json);
+        this.process?.stdin?.write(frame);
       } catch (error) {
         clearTimeout(timer);
         this.pendingRequests.delete(id);
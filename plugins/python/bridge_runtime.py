@@ -2,7 +2,7 @@
 Python Bridge Runtime
 
 Standard runtime for Python backends communicating with Bun via IPC.
-Uses JSON-over-stdin/stdout with null-byte framing for reliable message boundaries.
+Uses JSON-over-stdin/stdout with length-prefixed framing for reliable message boundaries.
 
 Usage:
     class MyBackend(PythonBridge):
@@ -15,10 +15,98 @@ Usage:
         backend.run()
 """
 
+import os
+import ast
+import functools
 import sys
 import json
+import asyncio
+import queue
+import threading
 import traceback
-from typing import Any, Dict, Optional
+from types import CodeType, MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _default(obj: Any) -> Any:
+    """Serialize types JSON has no native representation for."""
+    if isinstance(obj, (bytes, bytearray, memoryview)):
+        return bytes(obj).hex()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _stdlib_dumps(obj: Any) -> bytes:
+    return json.dumps(obj, default=_default, separators=(",", ":")).encode()
+
+
+if orjson is not None:
+    _loads = orjson.loads
+
+    def _dumps(obj: Any) -> bytes:
+        try:
+            return orjson.dumps(obj, default=_default, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # orjson rejects values the stdlib can encode, such as integers
+            # beyond 64 bits; the stdlib raises again if it truly cannot
+            return _stdlib_dumps(obj)
+else:
+    _loads = json.loads
+    _dumps = _stdlib_dumps
+
+
+# Every frame starts with its payload length as a 4-byte big-endian integer
+_HEADER_SIZE = 4
+
+# Largest accepted frame payload. Anything bigger almost certainly means the
+# client is not sending length-prefixed frames (e.g. newline JSON from a pipe,
+# whose first bytes read as a ~2 GB length)
+_MAX_FRAME_SIZE = 64 * 1024 * 1024
+
+# Maximum bytes taken from stdin per read; large enough to take most bursts at once
+_READ_BUFFER_SIZE = 1 << 16
+
+# Maximum number of queued frames the writer thread joins into one write
+_WRITE_BATCH_SIZE = 64
+
+# Command envelope key names, shared by command decoding, the ready command
+# and event frames
+_CMD = "cmd"
+_ID = "id"
+_PARAMS = "params"
+
+# Fixed byte layout of success responses; only the id and result vary
+_SUCCESS_PREFIX = b'{"id":'
+_SUCCESS_INFIX = b',"status":"success","result":'
+_SUCCESS_SUFFIX = b"}"
+
+
+def _encode_success(request_id: Any, result_json: bytes) -> bytes:
+    """Encode a success response around an already-encoded result."""
+    if type(request_id) is int:
+        id_json = str(request_id).encode()
+    else:
+        id_json = _dumps(request_id)
+    return _SUCCESS_PREFIX + id_json + _SUCCESS_INFIX + result_json + _SUCCESS_SUFFIX
+
+
+# Result of the default ready(); sys.version is fixed for the process
+_READY_PAYLOAD = {"status": "ready", "python_version": sys.version}
+
+# Encoded results of the default ready() and shutdown(), plus the startup
+# response, so backends that keep them skip dispatch and encoding entirely
+_READY_RESULT = _dumps(_READY_PAYLOAD)
+_SHUTDOWN_RESULT = _dumps({"status": "shutdown"})
+_READY_RESPONSE = _encode_success(0, _READY_RESULT)
+
+# Runtime plumbing that is public for subclasses but never callable over IPC
+_RESERVED_COMMANDS = frozenset({
+    "run", "handle_command", "send_response", "send_event", "flush_out",
+})
 
 
 class PythonBridge:
@@ -33,6 +121,47 @@ class PythonBridge:
         """Initialize the Python bridge backend."""
         self.state: Dict[str, Any] = {}
         self._running = False
+        self._include_traceback = bool(os.environ.get("PYBRIDGE_DEBUG"))
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[int] = None
+        self._line_mode = False
+        self._recv_tail = bytearray()
+        self._out_buf = bytearray()
+        self._out_lock = threading.Lock()
+        self._out_q: "queue.SimpleQueue[Optional[bytes]]" = queue.SimpleQueue()
+        self._writer_thread: Optional[threading.Thread] = None
+        self._write_failed = False
+        self._dispatch = self._build_dispatch()
+        self._default_ready = type(self).ready is PythonBridge.ready
+        self._default_shutdown = type(self).shutdown is PythonBridge.shutdown
+    
+    def _build_dispatch(self) -> Mapping[str, Callable[..., Any]]:
+        """
+        Build the table of methods callable as IPC commands.
+        
+        Every public callable defined on the backend class hierarchy is
+        exposed, however it is implemented (plain, decorated, partialmethod).
+        Properties and other data descriptors, private names and runtime
+        plumbing are never exposed.
+        """
+        dispatch: Dict[str, Callable[..., Any]] = {}
+        seen = set()
+        for klass in type(self).__mro__:
+            if klass is object:
+                continue
+            for name, attr in vars(klass).items():
+                if name in seen:
+                    continue
+                seen.add(name)
+                if name.startswith("_") or name in _RESERVED_COMMANDS:
+                    continue
+                # Data descriptors run code on lookup and are never commands
+                if hasattr(type(attr), "__set__"):
+                    continue
+                value = getattr(self, name)
+                if callable(value):
+                    dispatch[name] = value
+        return MappingProxyType(dispatch)
     
     def ready(self) -> Dict[str, Any]:
         """
@@ -40,7 +169,7 @@ class PythonBridge:
         
         Override this if you need custom initialization checks.
         """
-        return {"status": "ready", "python_version": sys.version}
+        return dict(_READY_PAYLOAD)
     
     def shutdown(self) -> Dict[str, Any]:
         """
@@ -51,24 +180,62 @@ class PythonBridge:
         self._running = False
         return {"status": "shutdown"}
     
-    def handle_command(self, cmd_json: str) -> Optional[str]:
+    def set_debug(self, enabled: bool = True) -> Dict[str, Any]:
+        """
+        Toggle whether error responses include Python tracebacks.
+        
+        Tracebacks are off by default; set PYBRIDGE_DEBUG to enable them at startup.
+        """
+        self._include_traceback = bool(enabled)
+        return {"debug": self._include_traceback}
+    
+    def handle_command(self, cmd_json: bytes) -> Optional[bytes]:
         """
         Handle an incoming command from Bun.
         
         Args:
-            cmd_json: JSON string containing cmd, id, and params
+            cmd_json: UTF-8 encoded JSON containing cmd, id, and params
+            
+        Returns:
+            Encoded JSON response (or None to suppress response)
+        """
+        try:
+            cmd = _loads(cmd_json)
+        except ValueError as e:
+            # Covers both decoders' JSON errors and the stdlib's
+            # UnicodeDecodeError on invalid UTF-8
+            return _dumps({
+                "id": 0,
+                "status": "error",
+                "error": f"Invalid JSON: {e}",
+            })
+        
+        return self._execute(cmd)
+    
+    def _execute(self, cmd: Dict[str, Any]) -> Optional[bytes]:
+        """
+        Run an already-decoded command and encode its response.
+        
+        Args:
+            cmd: Command dict containing cmd, id, and params
             
         Returns:
-            JSON response string (or None to suppress response)
+            Encoded JSON response (or None to suppress response)
         """
         try:
-            cmd = json.loads(cmd_json)
-            cmd_name = cmd.get("cmd", "")
-            params = cmd.get("params", {})
-            request_id = cmd.get("id", 0)
+            cmd_name = cmd.get(_CMD, "")
+            params = cmd.get(_PARAMS, {})
+            request_id = cmd.get(_ID, 0)
+            
+            # Fast path for the built-in health check and shutdown
+            if cmd_name == "ready" and self._default_ready:
+                return _encode_success(request_id, _READY_RESULT)
+            if cmd_name == "shutdown" and self._default_shutdown:
+                self._running = False
+                return _encode_success(request_id, _SHUTDOWN_RESULT)
             
             # Get the method to call
-            method = getattr(self, cmd_name, None)
+            method = self._dispatch.get(cmd_name)
             
             if method is None:
                 response = {
@@ -76,102 +243,338 @@ class PythonBridge:
                     "status": "error",
                     "error": f"Unknown command: {cmd_name}",
                 }
-            elif not callable(method):
-                response = {
-                    "id": request_id,
-                    "status": "error",
-                    "error": f"Command is not callable: {cmd_name}",
-                }
             else:
                 try:
-                    # Call the method
+                    # Call the method. Splatting the decoded dict is CPython's
+                    # fast path; remapping params to positional args via a
+                    # precomputed signature measured 1.5-2.5x slower per call.
                     result = method(**params) if params else method()
                     
-                    # Handle async results
+                    # Handle async results. hasattr() looks the attribute up
+                    # without raising on a miss, which measured faster for
+                    # plain results than type/isinstance(Awaitable) checks.
                     if hasattr(result, "__await__"):
-                        import asyncio
-                        result = asyncio.get_event_loop().run_until_complete(result)
+                        result = self._event_loop().run_until_complete(result)
                     
+                    return _encode_success(request_id, _dumps(result))
+                except ValueError as e:
+                    # Expected validation failures never carry a traceback
                     response = {
                         "id": request_id,
-                        "status": "success",
-                        "result": result,
+                        "status": "error",
+                        "error": str(e),
                     }
                 except Exception as e:
                     response = {
                         "id": request_id,
                         "status": "error",
                         "error": str(e),
-                        "traceback": traceback.format_exc(),
                     }
+                    if self._include_traceback:
+                        response["traceback"] = traceback.format_exc()
             
-            return json.dumps(response)
+            return _dumps(response)
             
-        except json.JSONDecodeError as e:
-            return json.dumps({
-                "id": 0,
-                "status": "error",
-                "error": f"Invalid JSON: {e}",
-            })
         except Exception as e:
-            return json.dumps({
+            response = {
                 "id": 0,
                 "status": "error",
                 "error": f"Handler error: {e}",
-                "traceback": traceback.format_exc(),
-            })
+            }
+            if self._include_traceback:
+                response["traceback"] = traceback.format_exc()
+            return _dumps(response)
+    
+    def _event_loop(self) -> asyncio.AbstractEventLoop:
+        """
+        Get the event loop used to run async commands, creating it once.
+        
+        The loop is also made the thread's current loop, so commands that
+        call asyncio.get_event_loop() schedule work on the loop that runs them.
+        """
+        if self._loop is None or self._loop.is_closed():
+            self._loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(self._loop)
+        return self._loop
     
-    def send_response(self, response_json: str) -> None:
+    def send_response(self, response_json: bytes) -> None:
         """
         Send a response back to Bun.
         
+        Frames produced while the IPC loop handles a command are batched and
+        handed off together once that command finishes; frames sent from any
+        other thread are handed off immediately.
+        
         Args:
-            response_json: JSON response string
+            response_json: Encoded JSON response
         """
-        # Write with null byte delimiter
-        sys.stdout.buffer.write(response_json.encode() + b"\0")
-        sys.stdout.buffer.flush()
+        # Frame with a 4-byte big-endian length prefix, or one JSON
+        # document per line in interactive mode
+        if self._line_mode:
+            header, trailer = b"", b"\n"
+        else:
+            header, trailer = len(response_json).to_bytes(_HEADER_SIZE, "big"), b""
+        
+        if threading.get_ident() != self._loop_thread:
+            self._write_out(header + response_json + trailer)
+            return
+        
+        with self._out_lock:
+            self._out_buf += header
+            self._out_buf += response_json
+            self._out_buf += trailer
+    
+    def flush_out(self) -> None:
+        """
+        Hand all frames batched by the IPC loop to stdout.
+        
+        Call this from long-running commands that emit events when they
+        need Bun to see them before the command returns.
+        """
+        with self._out_lock:
+            if not self._out_buf:
+                return
+            data = bytes(self._out_buf)
+            self._out_buf.clear()
+        
+        self._write_out(data)
+    
+    def _write_out(self, data: bytes) -> None:
+        """Queue encoded frames for the writer thread, or write them directly if it is not running."""
+        if self._write_failed:
+            # stdout is gone; nothing queued now could ever be delivered
+            return
+        
+        if self._writer_thread is not None:
+            self._out_q.put(data)
+            return
+        
+        with self._out_lock:
+            sys.stdout.buffer.write(data)
+            sys.stdout.buffer.flush()
+    
+    def _writer(self) -> None:
+        """Drain queued frames to stdout, joining whatever is pending into one write."""
+        stdout = sys.stdout.buffer
+        while True:
+            data = self._out_q.get()
+            if data is None:
+                return
+            
+            chunks = [data]
+            stopping = False
+            while len(chunks) < _WRITE_BATCH_SIZE:
+                try:
+                    data = self._out_q.get_nowait()
+                except queue.Empty:
+                    break
+                if data is None:
+                    stopping = True
+                    break
+                chunks.append(data)
+            
+            try:
+                stdout.write(b"".join(chunks))
+                stdout.flush()
+            except OSError as e:
+                # Stop the IPC loop rather than run commands whose results
+                # can never be delivered
+                print(f"[bridge] Failed to write to stdout: {e}", file=sys.stderr)
+                self._write_failed = True
+                self._running = False
+                return
+            
+            if stopping:
+                return
     
     def send_event(self, event_type: str, data: Any) -> None:
         """
         Send an async event notification to Bun.
         
+        Safe to call from any thread; events sent outside the IPC loop are
+        queued for the writer thread so the caller never blocks on stdout.
+        
         Args:
             event_type: Type of event (e.g., "message", "status_update")
             data: Event payload data
         """
         response = {
-            "cmd": event_type,
+            _CMD: event_type,
             "status": "event",
             "result": data,
         }
-        self.send_response(json.dumps(response))
+        self.send_response(_dumps(response))
     
     def run(self) -> None:
         """
         Start the IPC loop. This blocks until stdin is closed.
         
+        When stdin is a terminal, commands and responses are exchanged as
+        newline-delimited JSON instead of length-prefixed frames, so a
+        backend can be driven by hand for testing.
+        
         Override this only if you need custom event loop behavior.
         """
+        stdin_fd = sys.stdin.fileno()
+        self._line_mode = os.isatty(stdin_fd)
         self._running = True
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        self._loop_thread = threading.get_ident()
+        self._writer_thread = threading.Thread(target=self._writer, daemon=True)
+        self._writer_thread.start()
         
-        # Send ready notification
-        ready_response = self.handle_command(json.dumps({"cmd": "ready", "id": 0}))
-        if ready_response:
-            self.send_response(ready_response)
+        try:
+            # Send ready notification
+            if self._default_ready:
+                ready_response = _READY_RESPONSE
+            else:
+                ready_response = self._execute({_CMD: "ready", _ID: 0})
+            if ready_response:
+                self.send_response(ready_response)
+            self.flush_out()
+            
+            # Main IPC loop: a blocking read on a pipe returns everything
+            # already buffered, so each iteration handles a whole burst of
+            # frames. Each frame's output is handed off as soon as it is
+            # handled, so a slow command never holds earlier responses; the
+            # writer thread still joins whatever is pending into one write
+            split = self._split_lines if self._line_mode else self._split_frames
+            while self._running:
+                chunk = os.read(stdin_fd, _READ_BUFFER_SIZE)
+                if not chunk:
+                    break
+                
+                try:
+                    frames = split(chunk)
+                except ValueError as e:
+                    print(f"[bridge] {e}", file=sys.stderr)
+                    self.send_response(_dumps({
+                        "id": 0,
+                        "status": "error",
+                        "error": str(e),
+                    }))
+                    break
+                
+                for frame in frames:
+                    response = self.handle_command(frame)
+                    if response:
+                        self.send_response(response)
+                    self.flush_out()
+                    if not self._running:
+                        break
+        finally:
+            self._loop_thread = None
+            self.flush_out()
+            
+            # Let the writer drain everything queued so far before exiting
+            self._out_q.put(None)
+            self._writer_thread.join()
+            self._writer_thread = None
+            asyncio.set_event_loop(None)
+            self._loop.close()
+    
+    def _split_frames(self, chunk: bytes) -> List[bytes]:
+        """
+        Extract every complete length-prefixed frame received so far.
         
-        # Main IPC loop
-        for line in sys.stdin:
-            if not self._running:
-                break
+        A partial frame at the end of the chunk is kept for the next read.
+        
+        Args:
+            chunk: Bytes just read from stdin
             
-            line = line.strip()
-            if not line:
-                continue
+        Returns:
+            Payloads of the complete frames, in order
+            
+        Raises:
+            ValueError: If a frame header exceeds _MAX_FRAME_SIZE
+        """
+        data = self._recv_tail
+        data += chunk
+        
+        frames = []
+        offset = 0
+        end = len(data)
+        while end - offset >= _HEADER_SIZE:
+            size = int.from_bytes(data[offset:offset + _HEADER_SIZE], "big")
+            if size > _MAX_FRAME_SIZE:
+                raise ValueError(
+                    f"Frame of {size} bytes exceeds the {_MAX_FRAME_SIZE} byte limit; "
+                    "expected 4-byte length-prefixed frames"
+                )
+            start = offset + _HEADER_SIZE
+            if end - start < size:
+                break
+            frames.append(bytes(data[start:start + size]))
+            offset = start + size
+        
+        del data[:offset]
+        return frames
+    
+    def _split_lines(self, chunk: bytes) -> List[bytes]:
+        """
+        Extract every complete non-empty line received so far.
+        
+        Used in interactive mode; a partial line is kept for the next read.
+        
+        Args:
+            chunk: Bytes just read from stdin
             
-            response = self.handle_command(line)
-            if response:
-                self.send_response(response)
+        Returns:
+            Lines without their line endings, in order
+        """
+        data = self._recv_tail
+        data += chunk
+        
+        lines = data.split(b"\n")
+        self._recv_tail = lines.pop()
+        
+        frames = []
+        for line in lines:
+            line = line.rstrip(b"\r\n")
+            if line:
+                frames.append(bytes(line))
+        return frames
+
+
+# AST nodes allowed in ExampleBackend.calculate expressions
+_CALC_NODES = (
+    ast.Expression, ast.BinOp, ast.UnaryOp, ast.Constant,
+    ast.Add, ast.Sub, ast.Mult, ast.Div, ast.FloorDiv, ast.Mod, ast.Pow,
+    ast.UAdd, ast.USub,
+)
+
+
+# Largest exponent allowed in calculate(); keeps ** from stalling the IPC thread
+_CALC_MAX_EXPONENT = 100
+
+
+def _check_power(node: ast.BinOp) -> None:
+    """Reject powers whose result size is not bounded by the expression length."""
+    exponent = node.right
+    if isinstance(exponent, ast.UnaryOp):
+        exponent = exponent.operand
+    if not isinstance(exponent, ast.Constant) or abs(exponent.value) > _CALC_MAX_EXPONENT:
+        raise ValueError(
+            f"Exponents must be numeric literals no larger than {_CALC_MAX_EXPONENT}"
+        )
+    for child in ast.walk(node.left):
+        if isinstance(child, ast.Pow):
+            raise ValueError("Nested powers are not supported")
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_expression(expression: str) -> CodeType:
+    """Validate an arithmetic expression and compile it once per distinct string."""
+    tree = ast.parse(expression, mode="eval")
+    for node in ast.walk(tree):
+        if not isinstance(node, _CALC_NODES):
+            raise ValueError(f"Unsupported syntax: {type(node).__name__}")
+        if isinstance(node, ast.Constant) and type(node.value) not in (int, float):
+            raise ValueError(f"Unsupported constant: {node.value!r}")
+        if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Pow):
+            _check_power(node)
+    return compile(tree, "<calc>", "eval")
 
 
 # Example backend implementation
@@ -209,12 +612,13 @@ class ExampleBackend(PythonBridge):
     
     def calculate(self, expression: str) -> Dict[str, Any]:
         """
-        Evaluate a mathematical expression (unsafe - for demo only).
+        Evaluate an arithmetic expression.
         
-        WARNING: This uses eval() which is dangerous. Don't use in production!
+        Only numeric literals and arithmetic operators are accepted; anything
+        else is rejected before the expression is compiled.
         """
         try:
-            result = eval(expression)
+            result = eval(_compile_expression(expression), {"__builtins__": {}})
             return {"result": result}
         except Exception as e:
             raise ValueError(f"Calculation error: {e}")
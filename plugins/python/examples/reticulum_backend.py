@@ -8,10 +8,36 @@ with the Python Bridge plugin.
 import sys
 import json
 import time
+import functools
+import threading
+from collections import deque
 
 # Import the bridge runtime
 from bridge_runtime import PythonBridge
 
+# Import Reticulum once per process
+try:
+    import RNS
+    import LXMF
+    _AVAILABLE = True
+except ImportError:
+    RNS = LXMF = None
+    _AVAILABLE = False
+    print(
+        "Warning: Reticulum not installed. Install with: pip install reticulum lxmf",
+        file=sys.stderr
+    )
+
+# Longest receive_lxmf_message wait, kept below the 30 s default timeout of
+# PythonBackendHandle.call() so Bun never drops a request we may still answer
+_MAX_RECEIVE_WAIT_MS = 25000
+
+
+@functools.lru_cache(maxsize=1024)
+def _dest_hash(destination: str) -> bytes:
+    """Parse a hex destination hash, reusing the result for recent destinations."""
+    return bytes.fromhex(destination)
+
 
 class ReticulumBackend(PythonBridge):
     """
@@ -23,25 +49,32 @@ class ReticulumBackend(PythonBridge):
     
     def __init__(self):
         super().__init__()
-        self.identity = None
+        self._identity = None
+        self._identity_hash_hex = None
+        self._inbox = deque()
+        self._inbox_ready = threading.Condition()
         self.destination = None
         self.network = None
         self.lxmf_router = None
-        
-        # Try to import Reticulum
-        try:
-            import RNS
-            import LXMF
-            
-            self.RNS = RNS
-            self.LXMF = LXMF
-            self.available = True
-        except ImportError:
-            self.available = False
-            print(
-                "Warning: Reticulum not installed. Install with: pip install reticulum lxmf",
-                file=sys.stderr
-            )
+        self.RNS = RNS
+        self.LXMF = LXMF
+        self.available = _AVAILABLE
+    
+    @property
+    def identity(self):
+        """The active Reticulum identity."""
+        return self._identity
+    
+    @identity.setter
+    def identity(self, identity) -> None:
+        self._identity = identity
+        self._identity_hash_hex = None
+    
+    def _identity_hex(self) -> str:
+        """Hex form of the identity hash, computed once per identity."""
+        if self._identity_hash_hex is None:
+            self._identity_hash_hex = self._identity.hash.hex()
+        return self._identity_hash_hex
     
     def init(self, config_path: str = None, **options) -> dict:
         """
@@ -78,18 +111,20 @@ class ReticulumBackend(PythonBridge):
             
             print(f"[reticulum] AutoInterface enabled with group_id: {group_id}", file=sys.stderr)
         
-        # Create identity
-        self.identity = self.RNS.Identity(create_keys=True)
-        
-        # Initialize LXMF router for messaging
-        self.lxmf_router = self.LXMF.LXMRouter(
-            identity=self.identity,
-            storage_path="/tmp/lxmf_storage"
-        )
+        # Create identity and LXMF router for messaging once. The router is
+        # bound to its identity and cannot be torn down, so repeated init()
+        # calls keep both rather than registering a second delivery callback
+        if self.lxmf_router is None:
+            self.identity = self.RNS.Identity(create_keys=True)
+            self.lxmf_router = self.LXMF.LXMRouter(
+                identity=self.identity,
+                storage_path="/tmp/lxmf_storage"
+            )
+            self.lxmf_router.register_delivery_callback(self._on_lxmf_delivery)
         
         return {
             "status": "initialized",
-            "identity_hash": self.identity.hash.hex(),
+            "identity_hash": self._identity_hex(),
             "network": str(self.network),
         }
     
@@ -100,7 +135,7 @@ class ReticulumBackend(PythonBridge):
         
         self.identity = self.RNS.Identity(create_keys=True)
         return {
-            "hash": self.identity.hash.hex(),
+            "hash": self._identity_hex(),
             "created_at": time.time(),
         }
     
@@ -111,7 +146,7 @@ class ReticulumBackend(PythonBridge):
         
         self.identity = self.RNS.Identity.from_file(path)
         return {
-            "hash": self.identity.hash.hex(),
+            "hash": self._identity_hex(),
             "loaded_from": path,
         }
     
@@ -121,7 +156,7 @@ class ReticulumBackend(PythonBridge):
             return {"hash": None}
         
         return {
-            "hash": self.identity.hash.hex(),
+            "hash": self._identity_hex(),
         }
     
     def create_destination(self, aspects: list, app_name: str = "ronin") -> dict:
@@ -183,16 +218,17 @@ class ReticulumBackend(PythonBridge):
         if not self.available:
             raise RuntimeError("Reticulum not installed")
         
-        dest_hash = bytes.fromhex(destination)
+        dest_hash = _dest_hash(destination)
         data_bytes = bytes.fromhex(data)
         
         dest = self.RNS.Destination(dest_hash)
         packet = self.RNS.Packet(dest, data_bytes)
         receipt = packet.send()
         
+        # Raw bytes; the bridge encoder hex-encodes them for JSON
         return {
             "status": receipt.status,
-            "packet_hash": packet.packet_hash.hex(),
+            "packet_hash": packet.packet_hash,
         }
     
     def send_lxmf_message(
@@ -216,7 +252,7 @@ class ReticulumBackend(PythonBridge):
         if not self.lxmf_router:
             raise RuntimeError("LXMF router not initialized. Call init() first.")
         
-        dest_hash = bytes.fromhex(destination)
+        dest_hash = _dest_hash(destination)
         dest = self.RNS.Destination(dest_hash)
         
         message = self.LXMF.LXMessage(
@@ -234,10 +270,24 @@ class ReticulumBackend(PythonBridge):
             "status": "queued",
         }
     
+    def _on_lxmf_delivery(self, message) -> None:
+        """LXMF delivery callback; queues the message and wakes any waiting receiver."""
+        with self._inbox_ready:
+            self._inbox.append(message)
+            self._inbox_ready.notify()
+    
     def receive_lxmf_message(self, timeout: int = 5000) -> dict:
         """
         Receive an LXMF message.
         
+        Returns as soon as a message has been delivered, or None if none
+        arrives within the timeout.
+        
+        The wait runs on the IPC thread, so commands sent after this one
+        queue behind it until it returns. Responses to commands handled
+        before it are delivered before the wait starts. The wait is capped
+        at _MAX_RECEIVE_WAIT_MS, below the default Bun call timeout.
+        
         Args:
             timeout: Timeout in milliseconds
         """
@@ -246,11 +296,18 @@ class ReticulumBackend(PythonBridge):
         if not self.lxmf_router:
             raise RuntimeError("LXMF router not initialized")
         
-        # Poll for messages
-        messages = self.lxmf_router.get_messages()
+        # Deliver responses already computed before blocking the IPC thread
+        self.flush_out()
+        
+        # Wait for the delivery callback instead of polling the router
+        with self._inbox_ready:
+            wait = min(timeout, _MAX_RECEIVE_WAIT_MS) / 1000
+            if self._inbox_ready.wait_for(lambda: self._inbox, wait):
+                msg = self._inbox.popleft()
+            else:
+                msg = None
         
-        if messages:
-            msg = messages[0]
+        if msg is not None:
             return {
                 "hash": msg.hash.hex(),
                 "content": msg.content,
@@ -272,7 +329,7 @@ class ReticulumBackend(PythonBridge):
         
         return {
             "available": True,
-            "identity": self.identity.hash.hex() if self.identity else None,
+            "identity": self._identity_hex() if self.identity else None,
             "destination": self.destination.hash.hex() if self.destination else None,
             "network": str(self.network) if self.network else None,
         }
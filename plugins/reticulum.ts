@@ -432,6 +432,11 @@ const reticulumPlugin: Plugin = {
     /**
      * Receive an LXMF message
      * 
+     * Waits in the Python backend until a message arrives or the timeout
+     * expires (capped at 25 seconds). Calls already answered are delivered
+     * before the wait starts, but calls made during it queue behind it, so
+     * keep the timeout short when sending concurrently.
+     * 
      * @param timeout - Timeout in milliseconds (default: 5000)
      * @returns Message or null if no messages
      * 
@@ -443,9 +448,13 @@ const reticulumPlugin: Plugin = {
      */
     receiveMessage: async (timeout?: number): Promise<LXMFMessage | null> => {
       const backend = await getBackend();
+      const wait = timeout || 5000;
+
+      // Give the call room beyond the backend's wait so Bun never gives up
+      // on a request the backend may still answer with a dequeued message
       const result = await backend.call("receive_lxmf_message", {
-        timeout: timeout || 5000,
-      }) as any;
+        timeout: wait,
+      }, wait + 5000) as any;
       
       if (!result) return null;
       
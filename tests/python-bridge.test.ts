@@ -0,0 +1,107 @@
+/**
+ * Python Bridge Framing Unit Tests
+ * 
+ * Tests the length-prefixed framing used between Bun and Python backends:
+ * - Encoding frames
+ * - Splitting complete, partial and batched frames
+ * - Zero-length payloads
+ */
+
+import { describe, it, expect } from "bun:test";
+import { encodeFrame, decodeFrames } from "../plugins/python-bridge.js";
+
+const encoder = new TextEncoder();
+const decoder = new TextDecoder();
+
+function frame(text: string): Uint8Array {
+  return encodeFrame(encoder.encode(text));
+}
+
+function concat(...parts: Uint8Array[]): Uint8Array {
+  const total = parts.reduce((n, part) => n + part.length, 0);
+  const out = new Uint8Array(total);
+  let offset = 0;
+  for (const part of parts) {
+    out.set(part, offset);
+    offset += part.length;
+  }
+  return out;
+}
+
+function texts(frames: Uint8Array[]): string[] {
+  return frames.map((f) => decoder.decode(f));
+}
+
+describe("Python Bridge Framing", () => {
+  describe("encodeFrame", () => {
+    it("should prefix the payload with its big-endian length", () => {
+      const encoded = frame("abc");
+      expect(Array.from(encoded.subarray(0, 4))).toEqual([0, 0, 0, 3]);
+      expect(decoder.decode(encoded.subarray(4))).toBe("abc");
+    });
+
+    it("should encode a zero-length payload as a bare header", () => {
+      expect(Array.from(frame(""))).toEqual([0, 0, 0, 0]);
+    });
+  });
+
+  describe("decodeFrames", () => {
+    it("should decode a single complete frame", () => {
+      const { frames, rest } = decodeFrames(frame('{"id":1}'));
+      expect(texts(frames)).toEqual(['{"id":1}']);
+      expect(rest.length).toBe(0);
+    });
+
+    it("should decode multiple frames from one chunk", () => {
+      const { frames, rest } = decodeFrames(concat(frame("a"), frame("bb"), frame("ccc")));
+      expect(texts(frames)).toEqual(["a", "bb", "ccc"]);
+      expect(rest.length).toBe(0);
+    });
+
+    it("should keep a partial header for the next chunk", () => {
+      const data = frame("hello");
+      const first = decodeFrames(data.subarray(0, 2));
+      expect(first.frames).toEqual([]);
+
+      const second = decodeFrames(concat(first.rest, data.subarray(2)));
+      expect(texts(second.frames)).toEqual(["hello"]);
+      expect(second.rest.length).toBe(0);
+    });
+
+    it("should keep a partial payload for the next chunk", () => {
+      const data = concat(frame("hello"), frame("world"));
+      const first = decodeFrames(data.subarray(0, 12));
+      expect(texts(first.frames)).toEqual(["hello"]);
+      expect(first.rest.length).toBe(3);
+
+      const second = decodeFrames(concat(first.rest, data.subarray(12)));
+      expect(texts(second.frames)).toEqual(["world"]);
+      expect(second.rest.length).toBe(0);
+    });
+
+    it("should decode frames fed one byte at a time", () => {
+      const data = concat(frame("one"), frame(""), frame("three"));
+      const decoded: string[] = [];
+      let buffer = new Uint8Array(0);
+      for (let i = 0; i < data.length; i++) {
+        const { frames, rest } = decodeFrames(concat(buffer, data.subarray(i, i + 1)));
+        decoded.push(...texts(frames));
+        buffer = rest;
+      }
+      expect(decoded).toEqual(["one", "", "three"]);
+      expect(buffer.length).toBe(0);
+    });
+
+    it("should decode a zero-length payload", () => {
+      const { frames, rest } = decodeFrames(frame(""));
+      expect(frames.length).toBe(1);
+      expect(frames[0].length).toBe(0);
+      expect(rest.length).toBe(0);
+    });
+
+    it("should handle multi-byte UTF-8 payloads", () => {
+      const { frames } = decodeFrames(frame('{"echo":"héllo ✓"}'));
+      expect(JSON.parse(texts(frames)[0])).toEqual({ echo: "héllo ✓" });
+    });
+  });
+});
@@ -0,0 +1,330 @@
+"""
+Python Bridge Runtime Tests
+
+Tests the length-prefixed framing used between Bun and Python backends:
+- Splitting complete, partial and batched frames
+- Zero-length payloads
+- Oversized frame headers
+- Response encoding and the default ready payload
+- Invalid JSON and invalid UTF-8 input, with and without orjson
+- Command dispatch table contents
+- Commands returning awaitables
+- Responses not held back by slower commands
+- Stopping when stdout is closed
+- ExampleBackend.calculate expression limits
+- End-to-end round trip through a backend subprocess
+"""
+
+import functools
+import importlib.util
+import json
+import os
+import subprocess
+import sys
+import time
+import unittest
+from unittest import mock
+
+BRIDGE_DIR = os.path.join(os.path.dirname(__file__), "..", "..", "plugins", "python")
+sys.path.insert(0, BRIDGE_DIR)
+
+import bridge_runtime  # noqa: E402
+from bridge_runtime import ExampleBackend, PythonBridge, _MAX_FRAME_SIZE, _dumps  # noqa: E402
+
+
+def frame(payload: bytes) -> bytes:
+    return len(payload).to_bytes(4, "big") + payload
+
+
+class SplitFramesTest(unittest.TestCase):
+    def setUp(self):
+        self.bridge = PythonBridge()
+
+    def test_single_frame(self):
+        self.assertEqual(self.bridge._split_frames(frame(b'{"id":1}')), [b'{"id":1}'])
+        self.assertEqual(self.bridge._recv_tail, b"")
+
+    def test_multiple_frames_in_one_chunk(self):
+        chunk = frame(b"a") + frame(b"bb") + frame(b"ccc")
+        self.assertEqual(self.bridge._split_frames(chunk), [b"a", b"bb", b"ccc"])
+        self.assertEqual(self.bridge._recv_tail, b"")
+
+    def test_partial_header_is_kept(self):
+        data = frame(b"hello")
+        self.assertEqual(self.bridge._split_frames(data[:2]), [])
+        self.assertEqual(self.bridge._split_frames(data[2:]), [b"hello"])
+
+    def test_partial_payload_is_kept(self):
+        data = frame(b"hello") + frame(b"world")
+        self.assertEqual(self.bridge._split_frames(data[:7]), [])
+        self.assertEqual(self.bridge._split_frames(data[7:12]), [b"hello"])
+        self.assertEqual(self.bridge._recv_tail, data[9:12])
+        self.assertEqual(self.bridge._split_frames(data[12:]), [b"world"])
+        self.assertEqual(self.bridge._recv_tail, b"")
+
+    def test_byte_at_a_time(self):
+        data = frame(b"one") + frame(b"") + frame(b"three")
+        frames = []
+        for i in range(len(data)):
+            frames.extend(self.bridge._split_frames(data[i:i + 1]))
+        self.assertEqual(frames, [b"one", b"", b"three"])
+
+    def test_zero_length_payload(self):
+        self.assertEqual(self.bridge._split_frames(frame(b"")), [b""])
+        self.assertEqual(self.bridge._recv_tail, b"")
+
+    def test_oversized_frame_is_rejected(self):
+        header = (_MAX_FRAME_SIZE + 1).to_bytes(4, "big")
+        with self.assertRaises(ValueError):
+            self.bridge._split_frames(header)
+
+    def test_newline_json_is_rejected(self):
+        with self.assertRaises(ValueError):
+            self.bridge._split_frames(b'{"id": 1, "cmd": "ready"}\n')
+
+
+class ReadyTest(unittest.TestCase):
+    def test_ready_returns_a_fresh_payload(self):
+        payload = PythonBridge().ready()
+        payload["extra"] = True
+        self.assertNotIn("extra", PythonBridge().ready())
+
+
+class DumpsTest(unittest.TestCase):
+    def test_bytes_are_hex_encoded(self):
+        self.assertEqual(json.loads(_dumps({"hash": b"\x01\xff"})), {"hash": "01ff"})
+
+    def test_integers_beyond_64_bits(self):
+        self.assertEqual(json.loads(_dumps({"n": 2 ** 100})), {"n": 2 ** 100})
+
+    def test_non_string_keys(self):
+        self.assertEqual(json.loads(_dumps({1: "a"})), {"1": "a"})
+
+    def test_unserializable_raises(self):
+        with self.assertRaises(TypeError):
+            _dumps({"x": object()})
+
+
+class InvalidInputTest(unittest.TestCase):
+    INPUTS = (b"not json", b"\xc3\x28", b'{"id": 1')
+
+    def assert_invalid_json(self, runtime) -> None:
+        backend = runtime.ExampleBackend()
+        for payload in self.INPUTS:
+            response = json.loads(backend.handle_command(payload))
+            self.assertEqual(response["status"], "error", payload)
+            self.assertIn("Invalid JSON", response["error"], payload)
+
+    def test_invalid_json(self):
+        self.assert_invalid_json(bridge_runtime)
+
+    def test_invalid_json_without_orjson(self):
+        with mock.patch.dict(sys.modules, {"orjson": None}):
+            spec = importlib.util.spec_from_file_location(
+                "bridge_runtime_stdlib", os.path.join(BRIDGE_DIR, "bridge_runtime.py")
+            )
+            runtime = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(runtime)
+        self.assertIsNone(runtime.orjson)
+        self.assert_invalid_json(runtime)
+
+
+class DispatchBackend(PythonBridge):
+    def plain(self):
+        return "plain"
+
+    @functools.lru_cache(maxsize=None)
+    def cached(self):
+        return "cached"
+
+    def _scaled(self, factor):
+        return factor * 2
+
+    doubled = functools.partialmethod(_scaled, 1)
+
+    @staticmethod
+    def static():
+        return "static"
+
+    @property
+    def computed(self):
+        raise AssertionError("properties must not be evaluated")
+
+    constant = 42
+
+
+class DispatchTableTest(unittest.TestCase):
+    def setUp(self):
+        self.bridge = DispatchBackend()
+
+    def call(self, cmd: str) -> dict:
+        return json.loads(self.bridge.handle_command(json.dumps({"id": 1, "cmd": cmd}).encode()))
+
+    def test_public_callables_are_exposed(self):
+        self.assertEqual(self.call("plain")["result"], "plain")
+        self.assertEqual(self.call("cached")["result"], "cached")
+        self.assertEqual(self.call("doubled")["result"], 2)
+        self.assertEqual(self.call("static")["result"], "static")
+        self.assertEqual(self.call("ready")["result"]["status"], "ready")
+
+    def test_non_commands_are_not_exposed(self):
+        for name in ("computed", "constant", "_scaled", "__init__", "state",
+                     "run", "handle_command", "send_response", "send_event", "flush_out"):
+            response = self.call(name)
+            self.assertEqual(response["status"], "error", name)
+            self.assertEqual(response["error"], f"Unknown command: {name}")
+
+
+class CalculateTest(unittest.TestCase):
+    def setUp(self):
+        self.backend = ExampleBackend()
+
+    def test_arithmetic(self):
+        self.assertEqual(self.backend.calculate("2 + 3 * 4"), {"result": 14})
+        self.assertEqual(self.backend.calculate("2 ** 10"), {"result": 1024})
+        self.assertEqual(self.backend.calculate("2 ** -2"), {"result": 0.25})
+
+    def test_rejects_code(self):
+        for expression in ('__import__("os")', '"a" * 3', "x + 1", "True + 1"):
+            with self.assertRaises(ValueError, msg=expression):
+                self.backend.calculate(expression)
+
+    def test_rejects_unbounded_powers(self):
+        for expression in ("9**9**9**9", "(9**100)**100", "2**101", "2**(50+50)", "9**9e9"):
+            with self.assertRaises(ValueError, msg=expression):
+                self.backend.calculate(expression)
+
+
+# Backend whose commands return awaitables tied to the current event loop
+ASYNC_BACKEND = """
+import asyncio
+from bridge_runtime import PythonBridge
+
+class AsyncBackend(PythonBridge):
+    def future(self):
+        loop = asyncio.get_event_loop()
+        future = loop.create_future()
+        loop.call_soon(future.set_result, 7)
+        return future
+
+    async def coroutine(self):
+        await asyncio.sleep(0)
+        return 8
+
+AsyncBackend().run()
+"""
+
+
+# Backend with a command that blocks the IPC thread
+SLOW_BACKEND = """
+import time
+from bridge_runtime import PythonBridge
+
+class SlowBackend(PythonBridge):
+    def fast(self):
+        return "fast"
+
+    def slow(self):
+        time.sleep(2)
+        return "slow"
+
+SlowBackend().run()
+"""
+
+
+class RoundTripTest(unittest.TestCase):
+    def run_backend(self, stdin: bytes, script: str = None) -> list:
+        if script is None:
+            args = [sys.executable, os.path.join(BRIDGE_DIR, "bridge_runtime.py")]
+        else:
+            args = [sys.executable, "-c", script]
+        proc = subprocess.run(
+            args,
+            cwd=BRIDGE_DIR,
+            input=stdin,
+            capture_output=True,
+            timeout=10,
+        )
+        responses = []
+        out = proc.stdout
+        while out:
+            size = int.from_bytes(out[:4], "big")
+            responses.append(json.loads(out[4:4 + size]))
+            out = out[4 + size:]
+        return responses
+
+    def test_commands_round_trip(self):
+        responses = self.run_backend(
+            frame(b'{"id": 1, "cmd": "increment"}')
+            + frame(b'{"id": 2, "cmd": "echo", "params": {"data": "x"}}')
+        )
+        self.assertEqual(responses[0]["result"]["status"], "ready")
+        self.assertEqual(responses[1], {"id": 1, "status": "success", "result": {"count": 1}})
+        self.assertEqual(responses[2], {"id": 2, "status": "success", "result": {"echo": "x"}})
+
+    def test_zero_length_payload_is_an_error(self):
+        responses = self.run_backend(frame(b"") + frame(b'{"id": 1, "cmd": "get_count"}'))
+        self.assertEqual(responses[1]["status"], "error")
+        self.assertEqual(responses[2]["result"], {"count": 0})
+
+    def test_awaitable_results(self):
+        responses = self.run_backend(
+            frame(b'{"id": 1, "cmd": "future"}') + frame(b'{"id": 2, "cmd": "coroutine"}'),
+            ASYNC_BACKEND,
+        )
+        self.assertEqual(responses[1], {"id": 1, "status": "success", "result": 7})
+        self.assertEqual(responses[2], {"id": 2, "status": "success", "result": 8})
+
+    def test_slow_command_does_not_hold_earlier_responses(self):
+        proc = subprocess.Popen(
+            [sys.executable, "-c", SLOW_BACKEND],
+            cwd=BRIDGE_DIR,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+        )
+        self.addCleanup(proc.wait)
+        self.addCleanup(proc.kill)
+
+        def read_response() -> dict:
+            size = int.from_bytes(proc.stdout.read(4), "big")
+            return json.loads(proc.stdout.read(size))
+
+        read_response()  # ready
+        proc.stdin.write(frame(b'{"id": 1, "cmd": "fast"}') + frame(b'{"id": 2, "cmd": "slow"}'))
+        proc.stdin.flush()
+        start = time.monotonic()
+        self.assertEqual(read_response()["result"], "fast")
+        self.assertLess(time.monotonic() - start, 1)
+        self.assertEqual(read_response()["result"], "slow")
+
+    def test_closed_stdout_stops_the_loop(self):
+        proc = subprocess.Popen(
+            [sys.executable, os.path.join(BRIDGE_DIR, "bridge_runtime.py")],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+        self.addCleanup(proc.wait)
+        self.addCleanup(proc.kill)
+        proc.stdout.close()
+
+        # stdin stays open, so only the write failure can end the loop
+        for _ in range(100):
+            if proc.poll() is not None:
+                break
+            try:
+                proc.stdin.write(frame(b'{"id": 1, "cmd": "increment"}'))
+                proc.stdin.flush()
+            except BrokenPipeError:
+                break
+            time.sleep(0.05)
+        self.assertIsNotNone(proc.wait(timeout=5))
+
+    def test_newline_json_exits_with_error(self):
+        responses = self.run_backend(b'{"id": 1, "cmd": "get_count"}\n')
+        self.assertEqual(responses[-1]["status"], "error")
+        self.assertIn("length-prefixed", responses[-1]["error"])
+
+
+if __name__ == "__main__":
+    unittest.main()